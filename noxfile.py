@@ -26,10 +26,13 @@ locations = "src", "tests"
 )
 def tests(session: nox.Session) -> None:
     session.install(".[tests]")
+    # spread the tests over all the available cores on CI
+    xdist_args = ("-n", "auto", "--dist=worksteal") if os.environ.get("CI") else ()
     session.run(
         "pytest",
         "--cov",
         "--cov-config=pyproject.toml",
+        *xdist_args,
         *session.posargs,
         env={"COVERAGE_FILE": f".coverage.{session.python}"},
     )
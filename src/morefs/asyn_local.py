@@ -1,12 +1,30 @@
+import errno
+import io
+import os
 import shutil
+import stat
 import sys
-from asyncio import get_running_loop, iscoroutinefunction
-from functools import partial, wraps
-from typing import Awaitable, Callable, TypeVar
+import threading
+import time
+from asyncio import gather, get_running_loop, iscoroutinefunction
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial, wraps
+from typing import (
+    IO,
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
-import aiofile
 from fsspec.asyn import AsyncFileSystem
-from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.local import LocalFileOpener, LocalFileSystem
+from fsspec.utils import isfilelike
 
 if sys.version_info < (3, 10):  # pragma: no cover
     from typing_extensions import ParamSpec
@@ -16,26 +34,315 @@ else:  # pragma: no cover
 P = ParamSpec("P")
 R = TypeVar("R")
 
+COPY_BUFSIZE = max(shutil.COPY_BUFSIZE, 1 << 20)  # type: ignore[attr-defined]
+# buffers are reused across copies to avoid reallocating them for every chunk
+_BUF_POOL: List[bytearray] = []
+_BUF_POOL_MAXSIZE = 16
+_BUF_POOL_LOCK = threading.Lock()
+_SENDFILE_BLOCKSIZE = 1 << 20
+_COPY_FILE_RANGE_SIZE = 1 << 30
+_RM_BATCH_SIZE = 64
+# directories modified more recently than this may change again without their
+# mtime changing (timestamp granularity), so their listings are not cached.
+_LISTINGS_CACHE_MIN_AGE_NS = 2 * 10**9
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _reset_executor() -> None:
+    global _executor  # noqa: PLW0603
+    _executor = None
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no cover
+    # the executor's threads do not survive a fork
+    os.register_at_fork(after_in_child=_reset_executor)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the threadpool executor that the async methods run in.
+
+    Its size defaults to min(32, 4 * cpu_count), and can be set with the
+    `MOREFS_IO_THREADS` environment variable.
+    """
+    global _executor  # noqa: PLW0603
+    if _executor is not None:
+        return _executor
+    with _executor_lock:
+        if _executor is None:
+            max_workers = int(os.environ.get("MOREFS_IO_THREADS", 0)) or min(
+                32, (os.cpu_count() or 1) * 4
+            )
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="morefs-io"
+            )
+        return _executor
+
 
 def wrap(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
     @wraps(func)
     async def run(*args: P.args, **kwargs: P.kwargs) -> R:
         loop = get_running_loop()
         pfunc = partial(func, *args, **kwargs)
-        return await loop.run_in_executor(None, pfunc)
+        return await loop.run_in_executor(get_executor(), pfunc)
 
     return run
 
 
+def _sendfile_fd(fobj: Any) -> Optional[int]:
+    """Return the fd of `fobj` if bytes can be written to it directly."""
+    if not hasattr(os, "sendfile"):
+        return None
+    if isinstance(fobj, LocalFileOpener):
+        fobj = fobj.f
+    # anything else (text or compressed streams, etc.) may transform the data
+    if isinstance(fobj, (io.FileIO, io.BufferedWriter)):
+        return fobj.fileno()
+    return None
+
+
+def copyfileobj(fsrc: IO[bytes], fdst: IO[bytes]) -> None:
+    """Copy data from `fsrc` to `fdst`, in kernel space with sendfile() if possible."""
+    out_fd = _sendfile_fd(fdst)
+    if out_fd is not None:
+        fdst.flush()
+        in_fd = fsrc.fileno()
+        offset = 0
+        try:
+            while sent := os.sendfile(out_fd, in_fd, offset, _SENDFILE_BLOCKSIZE):
+                offset += sent
+        except OSError:
+            # eg: sendfile() to a regular file is not supported on macOS
+            if offset:
+                raise
+        else:
+            if fdst.seekable():
+                # sync the file object's position with the fd's
+                fdst.seek(0, os.SEEK_CUR)
+            return
+    shutil.copyfileobj(fsrc, fdst)
+
+
+def _is_a_directory(path: str) -> IsADirectoryError:
+    return IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+
+
+def _is_special_file(path: str) -> bool:
+    try:
+        return not stat.S_ISREG(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def copyfile(src: str, dst: str) -> None:
+    """Copy the contents of file `src` to `dst`.
+
+    Uses copy_file_range() where available, which copies in kernel space, and
+    clones the data instead on filesystems that support reflinks (eg: btrfs, XFS).
+    Falls back to shutil.copyfile() otherwise, and for destinations other than
+    regular files (eg: /dev/null, FIFOs), which it knows how to handle.
+    `src` is not checked, as cp_file() has stat'ed it already, and other sources
+    make copy_file_range() fail before anything is copied.
+    """
+    if not hasattr(os, "copy_file_range") or _is_special_file(dst):
+        shutil.copyfile(src, dst)
+        return
+
+    with open(src, "rb") as fsrc:
+        # not truncated yet, in case `src` and `dst` are the same file
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT, 0o666)
+        with open(out_fd, "wb") as fdst:
+            in_fd = fsrc.fileno()
+            if os.path.samestat(os.fstat(in_fd), os.fstat(out_fd)):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+            os.ftruncate(out_fd, 0)
+
+            copied = 0
+            try:
+                while n := os.copy_file_range(in_fd, out_fd, _COPY_FILE_RANGE_SIZE):
+                    copied += n
+            except OSError:
+                # eg: not supported by the filesystem or across filesystems
+                if copied:
+                    raise
+            if not copied:
+                # nothing copied can also mean a file whose size is not known
+                # upfront (eg: in /proc), so retry with a regular copy
+                copyfileobj(fsrc, fdst)
+
+
+def _fadvise_sequential(fobj) -> None:
+    """Hint the kernel to read ahead aggressively on `fobj`, if possible."""
+    if not hasattr(os, "posix_fadvise"):  # pragma: no cover
+        return
+    try:
+        os.posix_fadvise(fobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError, ValueError):
+        pass
+
+
+async def copy_asyncfileobj(fsrc, fdst) -> None:
+    """Copy data from async file `fsrc` (supporting readinto) to `fdst`."""
+    _fadvise_sequential(fsrc)
+    fdst_write = fdst.write
+    if not isinstance(fdst, AsyncFile):
+        # other async writers (eg: aiofile) may only accept bytes, which would
+        # have to be copied out of a pooled buffer anyway
+        fsrc_read = fsrc.read
+        while data := await fsrc_read(COPY_BUFSIZE):
+            await fdst_write(data)
+        return
+
+    with _BUF_POOL_LOCK:
+        buf = _BUF_POOL.pop() if _BUF_POOL else bytearray(COPY_BUFSIZE)
+    fsrc_readinto = fsrc.readinto
+    with memoryview(buf) as view:
+        while n := await fsrc_readinto(buf):
+            await fdst_write(view[:n])
+    # not reused after an error or cancellation, as the executor's thread may
+    # still be reading into or writing from it
+    with _BUF_POOL_LOCK:
+        if len(_BUF_POOL) < _BUF_POOL_MAXSIZE:
+            _BUF_POOL.append(buf)
+
+
+def _pread(fd: int, size: int, offset: int, to_eof: bool = False) -> bytes:
+    """Read `size` bytes of `fd` starting at `offset`, stopping early at EOF.
+
+    With `to_eof`, keeps reading past `size` until EOF, for files that grow or
+    whose size is not known upfront (eg: in /proc).
+    """
+    pread = getattr(os, "pread", None)
+    if pread is None:  # pragma: no cover
+        os.lseek(fd, offset, os.SEEK_SET)
+    chunks = []
+    while size > 0 or to_eof:
+        length = size if size > 0 else COPY_BUFSIZE
+        chunk = pread(fd, length, offset) if pread else os.read(fd, length)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+        offset += len(chunk)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _scantree(
+    path: str, it: "os._ScandirIterator", maxdepth: Optional[int] = None
+) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """Yield entries under `path` (listed by `it`) and if they are directories.
+
+    Unlike LocalFileSystem.walk(), this does not stat the entries, as DirEntry
+    knows if it is a directory from scandir() itself on most platforms.
+    """
+    pending: List[Tuple[str, int, Optional[os._ScandirIterator]]] = [(path, 1, it)]
+    while pending:
+        root, depth, scandir_it = pending.pop()
+        if scandir_it is None:
+            try:
+                scandir_it = os.scandir(root)
+            except OSError:
+                continue
+        with scandir_it:
+            for entry in scandir_it:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir and (maxdepth is None or depth < maxdepth):
+                    pending.append((entry.path, depth + 1, None))
+                yield entry, is_dir
+
+
+class _Listing(list):
+    """Cached directory listing, along with its directory's (st_ino, st_mtime_ns).
+
+    Kept with the listing itself, so that it goes away when dircache drops it.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, infos: List[dict], key: Tuple[int, int]) -> None:
+        super().__init__(infos)
+        self.key = key
+
+
+class AsyncFile:
+    """File object that runs the blocking file operations in a threadpool executor.
+
+    Returned by AsyncLocalFileSystem.open_async().
+    """
+
+    def __init__(self, fobj: IO) -> None:
+        self.fobj = fobj
+
+    @property
+    def name(self) -> str:
+        return self.fobj.name
+
+    @property
+    def mode(self) -> str:
+        return self.fobj.mode
+
+    @property
+    def closed(self) -> bool:
+        return self.fobj.closed
+
+    def fileno(self) -> int:
+        return self.fobj.fileno()
+
+    def tell(self) -> int:
+        return self.fobj.tell()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        # synchronous, like aiofile's, as it does not wait on the disk
+        return self.fobj.seek(offset, whence)
+
+    async def read(self, length: int = -1) -> Any:
+        return await wrap(self.fobj.read)(length)
+
+    async def readline(self, size: int = -1) -> Any:
+        return await wrap(self.fobj.readline)(size)
+
+    async def readinto(self, buffer: Any) -> int:
+        return await wrap(self.fobj.readinto)(buffer)  # type: ignore[attr-defined]
+
+    async def write(self, data: Any) -> int:
+        return await wrap(self.fobj.write)(data)
+
+    async def flush(self) -> None:
+        await wrap(self.fobj.flush)()
+
+    async def close(self) -> None:
+        await wrap(self.fobj.close)()
+
+    def __aiter__(self) -> "AsyncFile":
+        return self
+
+    async def __anext__(self) -> Any:
+        if line := await self.readline():
+            return line
+        raise StopAsyncIteration
+
+    async def __aenter__(self) -> "AsyncFile":
+        return self
+
+    async def __aexit__(self, *exc_args: object) -> None:
+        await self.close()
+
+
 class AsyncLocalFileSystem(AsyncFileSystem, LocalFileSystem):
     """Async implementation of LocalFileSystem.
 
-    This filesystem provides both async and sync methods. The sync methods are not
-    overridden and use LocalFileSystem's implementation.
+    This filesystem provides both async and sync methods. Most of the sync methods
+    are not overridden and use LocalFileSystem's implementation; the few that are
+    reimplemented here (eg: ls()) issue fewer syscalls and back their async
+    counterparts too.
 
-    The async methods run the respective sync methods in a threadpool executor.
+    The async methods run the respective sync methods in a threadpool executor
+    (see get_executor()), which also works with event loops like `uvloop`_.
     It also provides open_async() method that supports asynchronous file operations,
-    using `aiofile`_.
+    which are run in the same threadpool executor. Pass `use_aiofile=True` to use
+    `aiofile`_ instead.
 
     Note that some async methods like _find may call these wrapped async methods
     many times, and might have high overhead.
@@ -43,26 +350,250 @@ class AsyncLocalFileSystem(AsyncFileSystem, LocalFileSystem):
     which is available as `_*_async()` versions of the API.
     eg: _find_async()/_get_file_async, etc.
 
+    Pass `cache_listings=True` to cache directory listings, which are then reused
+    for as long as the directory's mtime does not change. Note that modifying
+    a file does not change its directory's mtime, so the details of the cached
+    entries (eg: size) may be stale; use invalidate_cache() to drop them.
+
     .. aiofile:
         https://github.com/mosquito/aiofile
+    .. uvloop:
+        https://github.com/MagicStack/uvloop
     """
 
     mirror_sync_methods = False
 
-    _cat_file = wrap(LocalFileSystem.cat_file)
+    def __init__(self, *args, cache_listings: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_listings = cache_listings
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        # absolute paths do not depend on the cwd, so their results can be cached
+        if os.sep == "/" and isinstance(path, str) and path.startswith("/"):
+            return cls._strip_absolute_path(path)
+        return super()._strip_protocol(path)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _strip_absolute_path(cls, path):
+        return super()._strip_protocol(path)
+
+    def invalidate_cache(self, path=None):
+        if path is None:
+            self.dircache.clear()
+        else:
+            path = self._strip_protocol(path)
+            prefix = path.rstrip("/") + "/"
+            for key in list(self.dircache):
+                if key == path or key.startswith(prefix):
+                    self.dircache.pop(key, None)
+        super().invalidate_cache(path)
+
+    def cp_file(self, path1, path2, **kwargs):
+        path1 = self._strip_protocol(path1)
+        path2 = self._strip_protocol(path2)
+        if self.auto_mkdir:
+            self.makedirs(self._parent(path2), exist_ok=True)
+        try:
+            mode = os.stat(path1).st_mode
+        except OSError:
+            mode = 0
+        # a single stat, instead of isfile() followed by isdir()
+        if stat.S_ISREG(mode):
+            copyfile(path1, path2)
+        elif stat.S_ISDIR(mode):
+            self.makedirs(path2, exist_ok=True)
+        else:
+            raise FileNotFoundError(path1)
+
+    def rm(self, path, recursive=False, maxdepth=None):  # noqa: ARG002
+        if not isinstance(path, list):
+            path = [path]
+
+        for p in path:
+            p = self._strip_protocol(p)
+            # lstat() tells both isdir() and islink() apart in one syscall
+            if stat.S_ISDIR(os.lstat(p).st_mode):
+                if not recursive:
+                    raise ValueError("Cannot delete directory, set recursive=True")
+                if os.path.abspath(p) == os.getcwd():
+                    raise ValueError("Cannot delete current working directory")
+                shutil.rmtree(p)
+            else:
+                os.remove(p)
+
+    def touch(self, path, truncate=True, **kwargs):
+        path = self._strip_protocol(path)
+        if self.auto_mkdir:
+            self.makedirs(self._parent(path), exist_ok=True)
+        if not truncate:
+            try:
+                return os.utime(path)
+            except FileNotFoundError:
+                pass
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if truncate else 0)
+        fd = os.open(path, flags, 0o666)
+        try:
+            os.utime(fd if os.utime in os.supports_fd else path)
+        finally:
+            os.close(fd)
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        if kwargs:
+            # eg: compression, which needs a file object to decompress with
+            return LocalFileSystem.cat_file(self, path, start=start, end=end, **kwargs)
+        path = self._strip_protocol(path)
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except PermissionError:
+            # Windows refuses to open directories instead
+            if os.path.isdir(path):
+                raise _is_a_directory(path) from None
+            raise
+        try:
+            st = os.fstat(fd)
+            if stat.S_ISDIR(st.st_mode):
+                raise _is_a_directory(path)
+            size = st.st_size
+            if start is None:
+                start = 0
+            elif start < 0:
+                start = max(0, size + start)
+            if end is None:
+                return _pread(fd, size - start, start, to_eof=True)
+            if end < 0:
+                end = size + end
+            return _pread(fd, end - start, start)
+        finally:
+            os.close(fd)
+
+    def created(self, path):
+        # avoid building the whole info() dict just for a timestamp
+        st = os.stat(self._strip_protocol(path))
+        created = getattr(st, "st_birthtime", st.st_ctime)
+        return datetime.fromtimestamp(created, tz=timezone.utc)
+
+    def modified(self, path):
+        st = os.stat(self._strip_protocol(path))
+        return datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
+
+    def mkdir(self, path, create_parents=True, **kwargs):
+        path = self._strip_protocol(path)
+        # both raise FileExistsError if the path exists, without checking first
+        if create_parents:
+            os.makedirs(path)
+        else:
+            os.mkdir(path, **kwargs)
+
+    def find(self, path, maxdepth=None, withdirs=False, detail=False, **kwargs):
+        if maxdepth is not None and maxdepth < 1:
+            raise ValueError("maxdepth must be at least 1")
+
+        path = self._strip_protocol(path)
+        try:
+            it = os.scandir(path)
+        except NotADirectoryError:
+            return self._find_nondir(path, detail)
+        except OSError:
+            return {} if detail else []
+
+        out = {}
+        if withdirs:
+            out[path] = self.info(path) if detail else None
+        for entry, is_dir in _scantree(path, it, maxdepth):
+            if is_dir and not withdirs:
+                continue
+            name = entry.path if os.sep == "/" else self._strip_protocol(entry.path)
+            if not detail:
+                out[name] = None
+                continue
+            try:
+                out[name] = self.info(entry)
+            except FileNotFoundError:
+                pass
+
+        names = sorted(out)
+        if not detail:
+            return names
+        return {name: out[name] for name in names}
+
+    def _find_nondir(self, path, detail):
+        # either a file, or a path with a file as one of its parents
+        try:
+            info = self.info(path)
+        except OSError:
+            return {} if detail else []
+        return {path: info} if detail else [path]
+
+    def get_file(self, path1, path2, callback=None, **kwargs):  # noqa: ARG002
+        if isfilelike(path2):
+            with open(path1, "rb") as fsrc:
+                return copyfileobj(fsrc, path2)
+        return self.cp_file(path1, path2, **kwargs)
+
+    def ls(self, path, detail=False, **kwargs):
+        path = self._strip_protocol(path)
+        if self.cache_listings:
+            return self._ls_cached(path, detail)
+        return self._scandir(path, detail)
+
+    def _ls_cached(self, path, detail):
+        st = os.stat(path)
+        if not stat.S_ISDIR(st.st_mode):
+            return self._scandir(path, detail)
+
+        key = (st.st_ino, st.st_mtime_ns)
+        infos = self.dircache.get(path)
+        if not isinstance(infos, _Listing) or infos.key != key:
+            if time.time_ns() - st.st_mtime_ns <= _LISTINGS_CACHE_MIN_AGE_NS:
+                # not cached, so names alone do not need any stat() calls
+                return self._scandir(path, detail)
+            infos = _Listing(self._scandir(path, detail=True), key)
+            self.dircache[path] = infos
+        if detail:
+            # copies, so that callers cannot modify the cached entries
+            return [info.copy() for info in infos]
+        return [info["name"] for info in infos]
+
+    def _scandir(self, path, detail):
+        try:
+            it = os.scandir(path)
+        except NotADirectoryError:
+            info = self.info(path)
+            return [info] if detail else [info["name"]]
+
+        with it:
+            if not detail:
+                if os.sep == "/":
+                    # `path` is normalized already, and so are the entries' paths
+                    return [entry.path for entry in it]
+                return [self._strip_protocol(entry.path) for entry in it]
+
+            infos = []
+            for entry in it:
+                try:
+                    # DirEntry caches the stat result from scandir(), so info()
+                    # only has to stat again for symlinks
+                    infos.append(self.info(entry))
+                except FileNotFoundError:
+                    pass
+        return infos
+
+    _cat_file = wrap(cat_file)
     _chmod = wrap(LocalFileSystem.chmod)
-    _cp_file = wrap(LocalFileSystem.cp_file)
-    _created = wrap(LocalFileSystem.created)
-    _find_async = wrap(LocalFileSystem.find)
-    _get_file_async = wrap(LocalFileSystem.get_file)
+    _cp_file = wrap(cp_file)
+    _created = wrap(created)
+    _find_async = wrap(find)
+    _get_file_async = wrap(get_file)
     _info = wrap(LocalFileSystem.info)
     _islink = wrap(LocalFileSystem.islink)
     _lexists = wrap(LocalFileSystem.lexists)
     _link = wrap(LocalFileSystem.link)
-    _ls = wrap(LocalFileSystem.ls)
+    _ls = wrap(ls)
     _makedirs = wrap(LocalFileSystem.makedirs)
-    _mkdir = wrap(LocalFileSystem.mkdir)
-    _modified = wrap(LocalFileSystem.modified)
+    _mkdir = wrap(mkdir)
+    _modified = wrap(modified)
 
     # `mv_file` was renamed to `mv` in fsspec==2024.5.0
     # https://github.com/fsspec/filesystem_spec/pull/1585
@@ -72,15 +603,63 @@ class AsyncLocalFileSystem(AsyncFileSystem, LocalFileSystem):
     _put_file = wrap(LocalFileSystem.put_file)
     _read_bytes = wrap(LocalFileSystem.read_bytes)
     _read_text = wrap(LocalFileSystem.read_text)
-    _rm = wrap(LocalFileSystem.rm)
+    _rm_async = wrap(rm)
     _rm_file = wrap(LocalFileSystem.rm_file)
     _rmdir = wrap(LocalFileSystem.rmdir)
-    _touch = wrap(LocalFileSystem.touch)
+    _touch = wrap(touch)
     _symlink = wrap(LocalFileSystem.symlink)
     _write_bytes = wrap(LocalFileSystem.write_bytes)
     _write_text = wrap(LocalFileSystem.write_text)
+    _cat_async = wrap(LocalFileSystem.cat)
+    _cat_ranges_async = wrap(LocalFileSystem.cat_ranges)
     sign = LocalFileSystem.sign
 
+    async def _cat(
+        self,
+        path,
+        recursive=False,
+        on_error="raise",
+        batch_size=None,  # noqa: ARG002
+        **kwargs,
+    ):
+        # read all files in a single executor job, rather than one job per file
+        return await self._cat_async(
+            path, recursive=recursive, on_error=on_error, **kwargs
+        )
+
+    async def _cat_ranges(  # noqa: PLR0913
+        self,
+        paths,
+        starts,
+        ends,
+        max_gap=None,
+        batch_size=None,  # noqa: ARG002
+        on_error="return",
+        **kwargs,
+    ):
+        return await self._cat_ranges_async(
+            paths, starts, ends, max_gap=max_gap, on_error=on_error, **kwargs
+        )
+
+    async def _rm(self, path, recursive=False, batch_size=None, maxdepth=None):
+        if not isinstance(path, list):
+            path = [path]
+        # with recursive=True, the paths may be nested in each other and need to be
+        # removed in order, so they are all removed in a single executor job
+        if recursive or len(path) <= 1:
+            return await self._rm_async(path, recursive=recursive, maxdepth=maxdepth)
+
+        # otherwise, spread the files over up to `batch_size` concurrent jobs
+        batch_size = batch_size or self.batch_size or _RM_BATCH_SIZE
+        size = -(-len(path) // batch_size)
+        results = await gather(
+            *(self._rm_async(path[i : i + size]) for i in range(0, len(path), size)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     async def _get_file(self, src, dst, **kwargs):  # pylint: disable=arguments-renamed
         if not iscoroutinefunction(getattr(dst, "write", None)):
             src = self._strip_protocol(src)
@@ -88,14 +667,25 @@ class AsyncLocalFileSystem(AsyncFileSystem, LocalFileSystem):
 
         fsrc = await self.open_async(src, "rb")
         async with fsrc:
-            while True:
-                buf = await fsrc.read(length=shutil.COPY_BUFSIZE)
-                if not buf:
-                    break
-                await dst.write(buf)
+            await copy_asyncfileobj(fsrc, dst)
+
+    def _open_file(self, path, mode, **kwargs):
+        try:
+            return open(path, mode, **kwargs)  # noqa: SIM115
+        except FileNotFoundError:
+            # only pay for creating the parent directory if it is missing
+            if not (self.auto_mkdir and "w" in mode):
+                raise
+        self.makedirs(self._parent(path), exist_ok=True)
+        return open(path, mode, **kwargs)  # noqa: SIM115
 
-    async def open_async(self, path, mode="rb", **kwargs):
+    async def open_async(self, path, mode="rb", use_aiofile=False, **kwargs):
         path = self._strip_protocol(path)
-        if self.auto_mkdir and "w" in mode:
-            await self._makedirs(self._parent(path), exist_ok=True)
-        return await aiofile.async_open(path, mode, **kwargs)
+        if use_aiofile:
+            import aiofile
+
+            if self.auto_mkdir and "w" in mode:
+                await self._makedirs(self._parent(path), exist_ok=True)
+            return await aiofile.async_open(path, mode, **kwargs)
+        fobj = await wrap(self._open_file)(path, mode, **kwargs)
+        return AsyncFile(fobj)
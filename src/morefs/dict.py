@@ -1,67 +1,137 @@
 import errno
 import os
 from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from functools import lru_cache, reduce
+from operator import getitem
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 from fsspec import AbstractFileSystem
 from fsspec.implementations.memory import MemoryFile
 
-ContainerOrFile = Union[Dict[str, Dict], "DictFile"]
+ContainerOrFile = Union["_Dir", "DictFile"]
 
+_PROTO = "dictfs://"
+_PROTO_LEN = len(_PROTO)
+_SEP = "/"
+_ROOT = ""
 
-class Store(dict):
+
+class _Dir(dict):
+    __slots__ = ()
+    is_dir: Literal[True] = True
+
+
+class Store(_Dir):
     def __init__(self, paths: Iterable[str] = ()) -> None:
         super().__init__()
         self.paths = tuple(paths)
+        # flat index of the nodes in the tree, keyed by their path parts, so
+        # that lookups do not have to walk the tree one level at a time.
+        self.nodes: Dict[Tuple[str, ...], ContainerOrFile] = {(): self}
 
     def new_child(self, paths: Iterable[str]) -> None:
-        self.set(paths, type(self)(paths=paths))
+        self.set(paths, _Dir())
 
     def set(self, paths: Iterable[str], value: Any, overwrite: bool = False) -> None:
         if not paths:
             raise ValueError("no path supplied")
 
-        *rest, key = paths
-        child = self.get(rest)
-
-        if not overwrite and key in child:
+        paths = tuple(paths)
+        child = self.get(paths[:-1])
+        key = paths[-1]
+
+        if overwrite:
+            old = self.nodes.get(paths)
+            child[key] = value
+            if old is not None:
+                self._unindex(paths, old)
+        # unbound, so that a file in place of a directory raises TypeError
+        elif dict.setdefault(child, key, value) is not value:  # type: ignore[arg-type]
             raise ValueError("cannot overwrite - item exists")
-        child[key] = value
+        self.nodes[paths] = value
 
     def get(self, paths: Iterable[str]) -> "ContainerOrFile":  # type: ignore[override]
-        child = self
-        for path in paths:
-            child = child[path]
-        return child
+        paths = tuple(paths)
+        try:
+            return self.nodes[paths]
+        except KeyError:
+            pass
+        # not indexed yet, walk the tree to find it or to raise the right error
+        item = reduce(getitem, paths, self)
+        self.nodes[paths] = item
+        return item
 
     def delete(self, paths: Iterable[str]) -> None:
         if not paths:
             self.clear()
             return
 
-        *rest, key = paths
-        child = self.get(rest)
-        del child[key]
+        paths = tuple(paths)
+        item = dict.pop(self.get(paths[:-1]), paths[-1])  # type: ignore[call-overload]
+        self._unindex(paths, item)
+
+    def ensure_path(self, paths: Iterable[str]) -> _Dir:
+        """Create the missing directories along `paths` in a single walk."""
+        paths = tuple(paths)
+        node: ContainerOrFile = self
+        for idx, key in enumerate(paths, 1):
+            if not node.is_dir:
+                raise TypeError("not a directory")
+            child = dict.get(node, key)
+            if child is None:
+                child = self.nodes[paths[:idx]] = _Dir()
+                node[key] = child
+            node = child
+        if not node.is_dir:
+            raise TypeError("not a directory")
+        return node
+
+    def clear(self) -> None:
+        super().clear()
+        self.nodes = {(): self}
+
+    def _unindex(self, paths: Tuple[str, ...], item: "ContainerOrFile") -> None:
+        self.nodes.pop(paths, None)
+        if item.is_dir:
+            for key, value in item.items():
+                self._unindex((*paths, key), value)
 
 
 def oserror(code: int, path: str) -> OSError:
     return OSError(code, os.strerror(code), path)
 
 
+# module-level, so that the caches are keyed on the path alone and not on the class
+@lru_cache(maxsize=4096)
+def _join_paths(paths: Tuple[str, ...]) -> str:
+    if not paths:
+        return _ROOT
+    return _SEP.join((_ROOT, *paths))
+
+
+@lru_cache(maxsize=4096)
+def _norm(path: str) -> Tuple[Tuple[str, ...], str]:
+    """Return both the path parts and the normalized path for `path`."""
+    path = DictFS._strip_protocol(path)
+    if path == "/":
+        return (), _ROOT
+    _root_marker, *parts = path.split(_SEP)
+    return tuple(parts), _join_paths(tuple(parts))
+
+
 class DictFS(AbstractFileSystem):  # pylint: disable=abstract-method
     cachable = False
     protocol = "dictfs"
-    root_marker = ""
+    root_marker = _ROOT
 
     @classmethod
     def _strip_protocol(cls, path: str) -> str:
-        if path.startswith("dictfs://"):
-            path = path[len("dictfs://") :]
-        if "::" in path or "://" in path:
+        if path.startswith(_PROTO):
+            path = path[_PROTO_LEN:]
+        if ":" in path and ("::" in path or "://" in path):
             return path.rstrip("/")
-        path = path.lstrip("/").rstrip("/")
-        return "/" + path if path else cls.root_marker
+        path = path.strip("/")
+        return _SEP + path if path else _ROOT
 
     def __init__(self, store: Optional[Store] = None) -> None:
         super().__init__()
@@ -76,69 +146,52 @@ class DictFS(AbstractFileSystem):  # pylint: disable=abstract-method
         file: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
-        if isinstance(item, dict):
+        if item.is_dir:
             return {"name": path, "size": 0, "type": "directory"}
-        assert isinstance(item, DictFile)
         return item.to_json(file=file)
 
-    @classmethod
-    @lru_cache(maxsize=1000)
-    def path_parts(cls, path: str) -> Tuple[str, ...]:
-        path = cls._strip_protocol(path)
-        if path == "/":
-            return ()
-        _root_marker, *parts = path.split(cls.sep)
-        return tuple(parts)
+    _norm = staticmethod(_norm)
+    join_paths = staticmethod(_join_paths)
 
-    @classmethod
-    @lru_cache(maxsize=1000)
-    def join_paths(cls, paths: Tuple[str, ...]) -> str:
-        if not paths:
-            return cls.root_marker
-        return cls.sep.join([cls.root_marker, *paths])
+    @staticmethod
+    def path_parts(path: str) -> Tuple[str, ...]:
+        return _norm(path)[0]
 
-    def info(self, path: str, **kwargs: Any) -> Dict[str, Any]:
-        paths = self.path_parts(path)
-        normpath = self.join_paths(paths)
+    def _get_item(self, path: str) -> Tuple[Tuple[str, ...], str, ContainerOrFile]:
+        paths, normpath = self._norm(path)
         try:
-            item = self.store.get(paths)
+            return paths, normpath, self.store.get(paths)
         except KeyError as exc:
             raise oserror(errno.ENOENT, normpath) from exc
         except TypeError as exc:
             raise oserror(errno.ENOTDIR, normpath) from exc
+
+    def info(self, path: str, **kwargs: Any) -> Dict[str, Any]:
+        _, normpath, item = self._get_item(path)
         return self._info(normpath, item, **kwargs)
 
     def ls(self, path: str, detail: bool = False, **kwargs: Any):
-        paths = self.path_parts(path)
-        normpath = self.join_paths(paths)
+        _, normpath, item = self._get_item(path)
 
-        try:
-            item = self.store.get(paths)
-        except KeyError as exc:
-            raise oserror(errno.ENOENT, normpath) from exc
-        except TypeError as exc:
-            raise oserror(errno.ENOTDIR, normpath) from exc
-
-        if not isinstance(item, dict):
+        if not item.is_dir:
             if not detail:
                 return [normpath]
             return [self._info(normpath, item)]
 
+        prefix = normpath + _SEP
+        sort = kwargs.get("sort")
+        if not detail:
+            keys: Iterable[str] = sorted(item) if sort else item
+            return [prefix + key for key in keys]
+
         entries: Iterable[Tuple[str, ContainerOrFile]] = item.items()
-        if kwargs.get("sort"):
+        if sort:
             entries = sorted(entries)
-
-        if not detail:
-            return [self.join_paths((*paths, key)) for key, _ in entries]
-        return [
-            self._info(self.join_paths((*paths, key)), value) for key, value in entries
-        ]
+        return [self._info(prefix + key, value) for key, value in entries]
 
     def _rm(self, path: str) -> None:
-        info = self.info(path)
-        paths = self.path_parts(path)
-        normpath = self.join_paths(paths)
-        if info["type"] == "directory":
+        paths, normpath, item = self._get_item(path)
+        if item.is_dir:
             raise oserror(errno.EISDIR, normpath)
         return self._rm_paths(paths)
 
@@ -152,30 +205,26 @@ class DictFS(AbstractFileSystem):  # pylint: disable=abstract-method
             raise oserror(errno.ENOENT, normpath) from exc
 
     def rmdir(self, path: str) -> None:
-        info = self.info(path)
-        paths = self.path_parts(path)
-        normpath = self.join_paths(paths)
+        paths, normpath, item = self._get_item(path)
 
-        if info["type"] == "file":
+        if not item.is_dir:
             raise oserror(errno.ENOTDIR, normpath)
 
-        if self.ls(path):
+        if item:
             raise oserror(errno.ENOTEMPTY, normpath)
         self._rm_paths(paths)
 
     def mkdir(self, path: str, create_parents: bool = True, **kwargs) -> None:
-        paths = self.path_parts(path)
-        normpath = self.join_paths(paths)
         try:
-            _ = self.store.get(paths)
-            raise oserror(errno.EEXIST, normpath)
-        except KeyError:
+            _, normpath, _ = self._get_item(path)
+        except FileNotFoundError:
             pass
-        except TypeError as exc:
-            raise oserror(errno.ENOTDIR, normpath) from exc
+        else:
+            raise oserror(errno.EEXIST, normpath)
 
+        paths = self.path_parts(path)
         if create_parents:
-            return self.makedirs(path, exist_ok=True)
+            return self._makedirs_paths(paths)
         self._mkdir_paths(paths)
 
     def _mkdir_paths(self, paths: Tuple[str, ...]) -> None:
@@ -190,25 +239,26 @@ class DictFS(AbstractFileSystem):  # pylint: disable=abstract-method
             raise oserror(errno.ENOENT, normpath) from exc
 
     def makedirs(self, path: str, exist_ok: bool = False) -> None:
-        paths = self.path_parts(path)
-        normpath = self.join_paths(paths)
         try:
-            _ = self.store.get(paths)
+            _, normpath, item = self._get_item(path)
+        except FileNotFoundError:
+            pass
+        else:
             if not exist_ok:
                 raise oserror(errno.EEXIST, normpath)
+            if not item.is_dir:
+                raise oserror(errno.ENOTDIR, normpath)
             return
-        except KeyError:
-            pass
+
+        self._makedirs_paths(self.path_parts(path))
+
+    def _makedirs_paths(self, paths: Tuple[str, ...]) -> None:
+        normpath = self.join_paths(paths)
+        try:
+            self.store.ensure_path(paths)
         except TypeError as exc:
             raise oserror(errno.ENOTDIR, normpath) from exc
 
-        for idx in range(len(paths)):
-            try:
-                self._mkdir_paths(paths[: idx + 1])
-            except FileExistsError:
-                if not exist_ok:
-                    raise
-
     def _open(
         self,
         path: str,
@@ -218,12 +268,11 @@ class DictFS(AbstractFileSystem):  # pylint: disable=abstract-method
         cache_options=None,  # noqa: ARG002
         **kwargs,
     ) -> "DictFile":
-        paths = self.path_parts(path)
-        normpath = self.join_paths(paths)
+        normpath = self._norm(path)[1]
 
         try:
-            info = self.info(path, file=True)
-            if info["type"] == "directory":
+            _, _, item = self._get_item(path)
+            if item.is_dir:
                 raise oserror(errno.EISDIR, normpath)
         except FileNotFoundError:
             if mode in ["rb", "ab", "rb+"]:
@@ -234,7 +283,8 @@ class DictFS(AbstractFileSystem):  # pylint: disable=abstract-method
             if not self._intrans:
                 file.commit()
         else:
-            file = info["file"]
+            assert not item.is_dir
+            file = item
             file.seek(0, os.SEEK_END if mode == "ab" else os.SEEK_SET)
         return file
 
@@ -281,6 +331,8 @@ class DictFS(AbstractFileSystem):  # pylint: disable=abstract-method
 
 
 class DictFile(MemoryFile):
+    is_dir: Literal[False] = False
+
     def commit(self) -> None:
         fs = self.fs
         paths = fs.path_parts(self.path)
@@ -6,6 +6,9 @@ from fsspec import AbstractFileSystem
 from fsspec.implementations.memory import MemoryFile
 from fsspec.implementations.memory import MemoryFileSystem as _MemFS
 
+# older fsspec versions do not expose the size of a MemoryFile
+_HAS_SIZE = hasattr(MemoryFile, "size")
+
 
 class MemFS(AbstractFileSystem):  # pylint: disable=abstract-method
     """In-Memory Object Storage FileSystem based on Trie data-structure."""
@@ -28,11 +31,7 @@ class MemFS(AbstractFileSystem):  # pylint: disable=abstract-method
         if filelike:
             return {
                 "name": path,
-                "size": (
-                    filelike.size
-                    if hasattr(filelike, "size")
-                    else filelike.getbuffer().nbytes
-                ),
+                "size": filelike.size if _HAS_SIZE else filelike.getbuffer().nbytes,
                 "type": "file",
                 "created": getattr(filelike, "created", None),
             }
@@ -87,12 +86,14 @@ class MemFS(AbstractFileSystem):  # pylint: disable=abstract-method
         for p in paths:
             self.store.pop(p, None)
 
+    def _check_not_dir(self, path):
+        if self.info(path)["type"] == "directory":
+            raise IsADirectoryError(errno.EISDIR, "Is a directory", path)
+
     def _open(self, path, mode="rb", **kwargs):  # pylint: disable=arguments-differ
         path = self._strip_protocol(path)
         try:
-            info = self.info(path)
-            if info["type"] == "directory":
-                raise IsADirectoryError(errno.EISDIR, "Is a directory", path)
+            self._check_not_dir(path)
         except FileNotFoundError:
             if mode in ["rb", "ab", "rb+"]:
                 raise
@@ -116,8 +117,18 @@ class MemFS(AbstractFileSystem):  # pylint: disable=abstract-method
         except IsADirectoryError:
             return
 
-        with src, self.open(path2, "wb") as dst:
-            dst.write(src.getbuffer())
+        try:
+            self._check_not_dir(path2)
+        except FileNotFoundError:
+            pass
+
+        # the new file shares the source's bytes until either one is modified
+        with src:
+            filelike = MemoryFile(self, path2, src.getvalue())
+        if self._intrans:
+            self.transaction.files.append(filelike)
+        else:
+            filelike.commit()
 
     def created(self, path):
         return self.info(path).get("created")
@@ -1,7 +1,7 @@
 import errno
 import os
 import shutil
-from typing import List
+from typing import Dict, List, Tuple
 
 import fsspec
 
@@ -21,67 +21,84 @@ class OverlayFileSystem(fsspec.AbstractFileSystem):  # pylint: disable=abstract-
             if options is None:
                 options = {}
             self.fses.append(fsspec.filesystem(proto, **options))
+
+        fs_protos: List[Tuple[str, ...]] = [
+            (fs.protocol,) if isinstance(fs.protocol, str) else tuple(fs.protocol)
+            for fs in self.fses
+        ]
+        self._proto_map: Dict[str, fsspec.AbstractFileSystem] = {}
+        for fs, protocols in zip(self.fses, fs_protos):
+            for fs_proto in protocols:
+                self._proto_map.setdefault(fs_proto, fs)
         super().__init__(*self.fses, **storage_options)
+        # bound once, instead of being looked up on each filesystem per call
+        self._info_funcs = self._bind_all("info")
+        self._created_funcs = self._bind_all("created")
+        self._modified_funcs = self._bind_all("modified")
+
+    def _bind_all(self, name):
+        return [func for fs in self.fses if (func := getattr(fs, name, None))]
 
     @property
     def upper_fs(self):
         return self.fses[0]
 
     def __getattr__(self, proto):
-        for fs in self.fses:
-            if isinstance(fs.protocol, str):
-                protocols = (fs.protocol,)
-            else:
-                protocols = fs.protocol
-
-            for fs_proto in protocols:
-                if proto == fs_proto:
-                    setattr(self, proto, fs)
-                    return fs
-        raise AttributeError
+        # looked up through __dict__, as this may run before __init__ sets it
+        fs = self.__dict__.get("_proto_map", {}).get(proto)
+        if fs is None:
+            raise AttributeError
+        setattr(self, proto, fs)
+        return fs
 
     def ls(self, path, detail=False, **kwargs):
-        listing = []
+        # entries from the upper filesystems shadow the ones below them
+        out = {}
         for fs in self.fses:
             try:
-                listing.extend(fs.ls(path, detail=detail, **kwargs))
+                listing = fs.ls(path, detail=detail, **kwargs)
             except (FileNotFoundError, NotImplementedError):
                 continue
 
+            if not detail:
+                out.update(dict.fromkeys(item.strip("/") for item in listing))
+                continue
+            for item in listing:
+                name = item["name"].strip("/")
+                if name not in out:
+                    out[name] = {**item, "name": name}
+
+        names = sorted(out) if kwargs.get("sort", True) else out
         if not detail:
-            return sorted({item.strip("/") for item in listing})
+            return list(names)
+        return [out[name] for name in names]
 
-        out = {}
-        for item in listing:
-            name = item["name"].strip("/")
-            out.setdefault(name, {**item, "name": name})
+    @staticmethod
+    def _first_of(funcs, path, *args, **kwargs):
+        for func in funcs:
+            try:
+                return func(path, *args, **kwargs)
+            except (
+                FileNotFoundError,
+                NotImplementedError,
+                AttributeError,
+            ):
+                continue
+        raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), path)
 
-        return [item for _, item in sorted(out.items())]
+    def info(self, path, **kwargs):
+        return self._first_of(self._info_funcs, path, **kwargs)
 
-    @staticmethod
-    def _iterate_fs_with(func):
-        def inner(self, path, *args, **kwargs):
-            for fs in self.fses:
-                try:
-                    return getattr(fs, func)(path, *args, **kwargs)
-                except (
-                    FileNotFoundError,
-                    NotImplementedError,
-                    AttributeError,
-                ):
-                    continue
-            raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+    def created(self, path):
+        return self._first_of(self._created_funcs, path)
 
-        return inner
+    def modified(self, path):
+        return self._first_of(self._modified_funcs, path)
 
     @staticmethod
     def _raise_readonly(path, *args, **kwargs):
         raise OSError(errno.EROFS, os.strerror(errno.EROFS), path)
 
-    info = _iterate_fs_with.__get__(object)("info")
-    created = _iterate_fs_with.__get__(object)("created")
-    modified = _iterate_fs_with.__get__(object)("modified")
-
     def mkdir(self, path, create_parents=True, **kwargs):
         # if create_parents is False:
         if self.exists(path):
@@ -0,0 +1,55 @@
+import asyncio
+import os
+import shutil
+import tempfile
+
+import fsspec
+import pytest
+
+_SHM = "/dev/shm"
+
+
+def pytest_configure(config):
+    # keep temporary files in memory where possible, unless asked otherwise
+    if config.option.basetemp is None and os.access(_SHM, os.W_OK):
+        config._morefs_shm_basetemp = tempfile.mkdtemp(
+            prefix="pytest-morefs-", dir=_SHM
+        )
+        config.option.basetemp = config._morefs_shm_basetemp
+
+
+def pytest_unconfigure(config):
+    basetemp = getattr(config, "_morefs_shm_basetemp", None)
+    if basetemp:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+def _write_tree(struct):
+    """Create the files in `struct` (``{path: contents}``) with raw fd calls."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for path, data in struct.items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, flags, 0o666)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture
+def write_tree():
+    return _write_tree
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", params=["asynclocal"])
+def any_fs(request):
+    return fsspec.filesystem(request.param)
@@ -1,122 +1,410 @@
+import asyncio
+import bz2
+import io
+import os
+import shutil
+import time
 from os import fspath
+from pathlib import Path
 
 import pytest
 from fsspec.implementations.local import LocalFileSystem
 
+from morefs import asyn_local
 from morefs.asyn_local import AsyncLocalFileSystem
 
+localfs = LocalFileSystem()
+_LEAVES = ((("foo",), b"foo"), (("bar",), b"bar"), (("dir", "file"), b"file"))
 
-@pytest.fixture
-def fs():
-    return AsyncLocalFileSystem()
 
+@pytest.fixture(scope="session")
+def auto_mkdir_fs():
+    return AsyncLocalFileSystem(auto_mkdir=True)
 
-@pytest.fixture
-def localfs():
-    return LocalFileSystem()
+
+def test_executor_size(monkeypatch):
+    monkeypatch.setenv("MOREFS_IO_THREADS", "3")
+    monkeypatch.setattr(asyn_local, "_executor", None)
+    executor = asyn_local.get_executor()
+    assert executor is asyn_local.get_executor()
+    assert executor._max_workers == 3
+    executor.shutdown()
+
+
+def test_strip_protocol(tmp_path, any_fs, monkeypatch):
+    for path in ["/", "/foo/bar/", "file:///foo/bar", "foo", "foo/bar/"]:
+        assert any_fs._strip_protocol(path) == localfs._strip_protocol(path)
+
+    monkeypatch.chdir(tmp_path)
+    assert any_fs._strip_protocol("foo") == localfs._strip_protocol(tmp_path / "foo")
 
 
 @pytest.mark.asyncio
-async def test_ls(tmp_path, localfs, fs):
-    struct = {
-        fspath(tmp_path / "foo"): b"foo",
-        fspath(tmp_path / "bar"): b"bar",
-        fspath(tmp_path / "dir" / "file"): b"file",
+@pytest.mark.parametrize("mode", ["sync", "async"])
+async def test_ls(tmp_path, any_fs, write_tree, mode):
+    async def call(name, *args, **kwargs):
+        if mode == "sync":
+            return getattr(any_fs, name)(*args, **kwargs)
+        return await getattr(any_fs, "_" + name)(*args, **kwargs)
+
+    write_tree({fspath(tmp_path.joinpath(*parts)): data for parts, data in _LEAVES})
+    foo, bar, d = (tmp_path / name for name in ("foo", "bar", "dir"))
+
+    assert set(await call("ls", tmp_path, detail=False)) == {
+        localfs._strip_protocol(p) for p in (foo, bar, d)
     }
-    localfs.mkdir(tmp_path / "dir")
-    localfs.pipe(struct)
+    assert await call("ls", tmp_path, detail=False) == localfs.ls(
+        tmp_path, detail=False
+    )
 
-    assert set(await fs._ls(tmp_path, detail=False)) == {
-        localfs._strip_protocol(tmp_path / f) for f in ["foo", "bar", "dir"]
-    }
-    assert await fs._ls(tmp_path, detail=False) == localfs.ls(tmp_path, detail=False)
+    assert await call("info", foo) == localfs.info(foo)
+    assert await call("info", d) == localfs.info(d)
+
+    with os.scandir(tmp_path) as it:
+        expected = [localfs.info(entry) for entry in it]
+    assert await call("ls", tmp_path, detail=True) == expected
+    assert localfs.ls(tmp_path, detail=True) == expected
+    assert await call("ls", foo, detail=True) == localfs.ls(foo, detail=True)
+    with pytest.raises(FileNotFoundError):
+        await call("ls", tmp_path / "not-existing-dir")
 
-    assert await fs._info(tmp_path / "foo") == localfs.info(tmp_path / "foo")
-    assert await fs._info(tmp_path / "dir") == localfs.info(tmp_path / "dir")
+    assert await call("find", tmp_path, detail=False) == localfs.find(
+        tmp_path, detail=False
+    )
+    assert await call("find", tmp_path, detail=True) == localfs.find(
+        tmp_path, detail=True
+    )
 
-    assert await fs._ls(tmp_path, detail=True) == localfs.ls(tmp_path, detail=True)
+    assert await asyncio.gather(
+        call("isfile", foo),
+        call("isdir", d),
+        call("exists", bar),
+        call("exists", tmp_path / "not-existing-file"),
+        call("lexists", foo),
+    ) == [True, True, True, False, True]
 
-    assert await fs._find(tmp_path, detail=False) == localfs.find(
-        tmp_path,
-        detail=False,
+
+@pytest.mark.asyncio
+async def test_find(tmp_path, any_fs, write_tree):
+    localfs.mkdir(tmp_path / "dir" / "subdir" / "subsubdir")
+    localfs.mkdir(tmp_path / "empty")
+    write_tree(
+        {
+            fspath(tmp_path / "foo"): b"foo",
+            fspath(tmp_path / "dir" / "bar"): b"bar",
+            fspath(tmp_path / "dir" / "subdir" / "foobar"): b"foobar",
+        }
     )
-    assert await fs._find(tmp_path, detail=True) == localfs.find(tmp_path, detail=True)
+    localfs.symlink(tmp_path / "dir", tmp_path / "link")
 
-    assert await fs._isfile(tmp_path / "foo")
-    assert await fs._isdir(tmp_path / "dir")
-    assert await fs._exists(tmp_path / "bar")
-    assert not await fs._exists(tmp_path / "not-existing-file")
-    assert await fs._lexists(tmp_path / "foo")
+    paths = [
+        tmp_path,
+        tmp_path / "dir",
+        tmp_path / "foo",
+        tmp_path / "missing",
+        tmp_path / "foo" / "missing",
+    ]
+    for path in paths:
+        for maxdepth in [None, 1, 2]:
+            for withdirs in [False, True]:
+                for detail in [False, True]:
+                    kwargs = {
+                        "maxdepth": maxdepth,
+                        "withdirs": withdirs,
+                        "detail": detail,
+                    }
+                    expected = localfs.find(path, **kwargs)
+                    assert any_fs.find(path, **kwargs) == expected
+                    assert await any_fs._find_async(path, **kwargs) == expected
+
+    with pytest.raises(ValueError, match="maxdepth"):
+        any_fs.find(tmp_path, maxdepth=0)
 
 
-def test_sync_methods(tmp_path, localfs, fs):
-    struct = {
-        fspath(tmp_path / "foo"): b"foo",
-        fspath(tmp_path / "bar"): b"bar",
-        fspath(tmp_path / "dir" / "file"): b"file",
-    }
-    localfs.mkdir(tmp_path / "dir")
-    localfs.pipe(struct)
+@pytest.mark.asyncio
+async def test_cache_listings(tmp_path, mocker):
+    fs = AsyncLocalFileSystem(cache_listings=True)
+    await fs._pipe_file(tmp_path / "foo", b"foo")
+    # too recently modified to be cached, so the entries are not stat'ed
+    info = mocker.spy(fs, "info")
+    assert len(await fs._ls(tmp_path)) == 1
+    assert not info.called
+    assert not fs.dircache
+
+    # pretend the directory was last modified a while ago
+    mtime = time.time() - 60
+    os.utime(tmp_path, (mtime, mtime))
+    expected = await fs._ls(tmp_path, detail=True)
+    assert [info["name"] for info in expected] == [fs._strip_protocol(tmp_path / "foo")]
+    # the cached entries cannot be modified through the returned listing
+    expected[0]["size"] = 0
+    assert (await fs._ls(tmp_path, detail=True))[0]["size"] == 3
+    assert isinstance(fs.dircache[fs._strip_protocol(tmp_path)], list)
+
+    await fs._pipe_file(tmp_path / "bar", b"bar")
+    os.utime(tmp_path, (mtime + 1, mtime + 1))
+    assert len(await fs._ls(tmp_path)) == 2
+
+    # not picked up, as the directory's mtime is the same as the cached one
+    await fs._pipe_file(tmp_path / "foobar", b"foobar")
+    os.utime(tmp_path, (mtime + 1, mtime + 1))
+    assert len(await fs._ls(tmp_path)) == 2
+
+    fs.invalidate_cache(tmp_path)
+    assert len(await fs._ls(tmp_path)) == 3
+    assert await fs._ls(tmp_path / "foo") == [fs._strip_protocol(tmp_path / "foo")]
 
-    assert set(fs.ls(tmp_path, detail=False)) == {
-        localfs._strip_protocol(tmp_path / f) for f in ["foo", "bar", "dir"]
-    }
-    assert fs.ls(tmp_path, detail=False) == localfs.ls(tmp_path, detail=False)
 
-    assert fs.info(tmp_path / "foo") == localfs.info(tmp_path / "foo")
-    assert fs.info(tmp_path / "dir") == localfs.info(tmp_path / "dir")
+@pytest.mark.asyncio
+async def test_mkdir(tmp_path, any_fs):
+    await any_fs._mkdir(tmp_path / "dir" / "subdir")
+    assert await any_fs._isdir(tmp_path / "dir" / "subdir")
+    with pytest.raises(FileExistsError):
+        await any_fs._mkdir(tmp_path / "dir" / "subdir")
+
+    await any_fs._mkdir(tmp_path / "dir2", create_parents=False)
+    assert await any_fs._isdir(tmp_path / "dir2")
+    with pytest.raises(FileExistsError):
+        await any_fs._mkdir(tmp_path / "dir2", create_parents=False)
+    with pytest.raises(FileNotFoundError):
+        await any_fs._mkdir(tmp_path / "dir3" / "subdir", create_parents=False)
 
-    assert fs.ls(tmp_path, detail=True) == localfs.ls(tmp_path, detail=True)
-    assert fs.find(tmp_path, detail=False) == localfs.find(tmp_path, detail=False)
-    assert fs.find(tmp_path, detail=True) == localfs.find(tmp_path, detail=True)
 
-    assert fs.isfile(tmp_path / "foo")
-    assert fs.isdir(tmp_path / "dir")
-    assert fs.exists(tmp_path / "bar")
-    assert not fs.exists(tmp_path / "not-existing-file")
-    assert fs.lexists(tmp_path / "foo")
+@pytest.mark.asyncio
+async def test_cp_file(tmp_path, any_fs):
+    await any_fs._pipe_file(tmp_path / "foo", b"foo")
+    await any_fs._mkdir(tmp_path / "dir")
+
+    await any_fs._cp_file(tmp_path / "foo", tmp_path / "bar")
+    assert await any_fs._cat_file(tmp_path / "bar") == b"foo"
+    await any_fs._pipe_file(tmp_path / "bar", b"contents")
+    await any_fs._cp_file(tmp_path / "foo", tmp_path / "bar")
+    assert await any_fs._cat_file(tmp_path / "bar") == b"foo"
+    await any_fs._pipe_file(tmp_path / "empty", b"")
+    await any_fs._cp_file(tmp_path / "empty", tmp_path / "bar")
+    assert await any_fs._cat_file(tmp_path / "bar") == b""
+    with pytest.raises(shutil.SameFileError):
+        await any_fs._cp_file(tmp_path / "foo", tmp_path / "foo")
+    assert await any_fs._cat_file(tmp_path / "foo") == b"foo"
+    await any_fs._cp_file(tmp_path / "dir", tmp_path / "dir2")
+    assert await any_fs._isdir(tmp_path / "dir2")
+    with pytest.raises(FileNotFoundError):
+        await any_fs._cp_file(tmp_path / "not-existing-file", tmp_path / "file")
+
+    if os.name == "posix":
+        await any_fs._cp_file(tmp_path / "foo", os.devnull)
+    if hasattr(os, "mkfifo"):
+        os.mkfifo(tmp_path / "fifo")
+        with pytest.raises(shutil.SpecialFileError):
+            await any_fs._cp_file(tmp_path / "foo", tmp_path / "fifo")
+
+
+@pytest.mark.asyncio
+async def test_rm(tmp_path, any_fs):
+    foo, bar, d, link = (tmp_path / name for name in ("foo", "bar", "dir", "link"))
+    await any_fs._pipe_file(foo, b"foo")
+    await any_fs._mkdir(d)
+    await any_fs._pipe_file(d / "file", b"file")
+    await any_fs._symlink(d, link)
+
+    await any_fs._rm(foo)
+    assert not await any_fs._exists(foo)
+    with pytest.raises(FileNotFoundError):
+        await any_fs._rm(foo)
+
+    await any_fs._rm(link)
+    assert not await any_fs._lexists(link)
+    assert await any_fs._isdir(d)
+
+    with pytest.raises(ValueError, match="recursive=True"):
+        await any_fs._rm(d)
+    await any_fs._rm(d, recursive=True)
+    assert not await any_fs._exists(d)
+
+    files = [tmp_path / f"file{i}" for i in range(10)]
+    await any_fs._pipe({fspath(f): b"" for f in files})
+    await any_fs._rm(files, batch_size=3)
+    assert not await any_fs._ls(tmp_path)
+
+    await any_fs._pipe_file(foo, b"foo")
+    with pytest.raises(FileNotFoundError):
+        await any_fs._rm([foo, bar], batch_size=2)
+    assert not await any_fs._exists(foo)
+
+
+@pytest.mark.asyncio
+async def test_try_rm_recursive_cwd(tmp_path, any_fs, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError, match="current working directory"):
+        await any_fs._rm(tmp_path, recursive=True)
 
 
 @pytest.mark.asyncio
-async def test_open_async(tmp_path, fs):
-    f = await fs.open_async(tmp_path / "file", mode="wb")
+async def test_link(tmp_path, any_fs):
+    await any_fs._pipe_file(tmp_path / "foo", b"foo")
+    await any_fs._link(tmp_path / "foo", tmp_path / "bar")
+    assert await any_fs._cat_file(tmp_path / "bar") == b"foo"
+    assert not await any_fs._islink(tmp_path / "bar")
+    assert os.path.samefile(tmp_path / "foo", tmp_path / "bar")
+
+
+@pytest.mark.asyncio
+async def test_symlink(tmp_path, any_fs):
+    await any_fs._pipe_file(tmp_path / "foo", b"foo")
+    await any_fs._symlink(tmp_path / "foo", tmp_path / "bar")
+    assert await any_fs._islink(tmp_path / "bar")
+    assert await any_fs._cat_file(tmp_path / "bar") == b"foo"
+
+    await any_fs._rm(tmp_path / "foo")
+    assert await any_fs._lexists(tmp_path / "bar")
+    assert not await any_fs._exists(tmp_path / "bar")
+
+
+@pytest.mark.asyncio
+async def test_touch(tmp_path, any_fs):
+    await any_fs._touch(tmp_path / "file")
+    assert await any_fs._cat_file(tmp_path / "file") == b""
+
+    await any_fs._pipe_file(tmp_path / "file", b"contents")
+    os.utime(tmp_path / "file", (0, 0))
+    await any_fs._touch(tmp_path / "file", truncate=False)
+    assert await any_fs._cat_file(tmp_path / "file") == b"contents"
+    assert (await any_fs._info(tmp_path / "file"))["mtime"] > 0
+
+    os.utime(tmp_path / "file", (0, 0))
+    await any_fs._touch(tmp_path / "file")
+    assert await any_fs._cat_file(tmp_path / "file") == b""
+    assert (await any_fs._info(tmp_path / "file"))["mtime"] > 0
+
+    await any_fs._touch(tmp_path / "file2", truncate=False)
+    assert await any_fs._isfile(tmp_path / "file2")
+
+
+@pytest.mark.asyncio
+async def test_created_modified(tmp_path, any_fs):
+    await any_fs._pipe_file(tmp_path / "foo", b"foo")
+    await any_fs._symlink(tmp_path / "foo", tmp_path / "link")
+
+    for path in [tmp_path / "foo", tmp_path / "link"]:
+        assert await any_fs._created(path) == localfs.created(path)
+        assert await any_fs._modified(path) == localfs.modified(path)
+
+
+@pytest.mark.asyncio
+async def test_open_async(tmp_path, any_fs):
+    f = await any_fs.open_async(tmp_path / "file", mode="wb")
     async with f:
         pass
-    assert await fs._exists(tmp_path / "file")
+    assert await any_fs._exists(tmp_path / "file")
 
-    f = await fs.open_async(tmp_path / "file", mode="wb")
+    f = await any_fs.open_async(tmp_path / "file", mode="wb")
     async with f:
         assert await f.write(b"contents")
 
-    f = await fs.open_async(tmp_path / "file")
+    f = await any_fs.open_async(tmp_path / "file")
     async with f:
         assert await f.read() == b"contents"
 
+    f = await any_fs.open_async(tmp_path / "file")
+    async with f:
+        assert f.seek(3) == 3
+        assert f.tell() == 3
+        assert await f.read(length=4) == b"tent"
+    assert f.closed
+
+    await any_fs._pipe_file(tmp_path / "lines", b"foo\nbar\nfoobar")
+    for use_aiofile in [False, True]:
+        # same call patterns as aiofile's file objects
+        f = await any_fs.open_async(tmp_path / "lines", use_aiofile=use_aiofile)
+        async with f:
+            f.seek(4)
+            assert f.tell() == 4
+            assert await f.read(3) == b"bar"
+            f.seek(0)
+            assert await f.readline() == b"foo\n"
+
+        f = await any_fs.open_async(tmp_path / "lines", use_aiofile=use_aiofile)
+        async with f:
+            assert [line async for line in f] == [b"foo\n", b"bar\n", b"foobar"]
+
 
 @pytest.mark.asyncio
-async def test_get_file(tmp_path, fs):
-    await fs._pipe_file(tmp_path / "foo", b"foo")
-    await fs._get_file(tmp_path / "foo", tmp_path / "bar")
+async def test_get_file(tmp_path, any_fs, mocker, monkeypatch):
+    foo, bar = tmp_path / "foo", tmp_path / "bar"
+    await any_fs._pipe_file(foo, b"foo")
+    if hasattr(os, "copy_file_range"):
+        # local to local copies should be left to the kernel
+        copy_file_range = mocker.spy(os, "copy_file_range")
+        await any_fs._get_file(foo, bar)
+        assert copy_file_range.called
+    else:
+        await any_fs._get_file(foo, bar)
+
+    assert await any_fs._cat_file(bar) == b"foo"
+
+    f = await any_fs.open_async(tmp_path / "file1", mode="wb")
+    async with f:
+        await any_fs._get_file(foo, f)
+    assert await any_fs._cat_file(tmp_path / "file1") == b"foo"
 
-    assert await fs._isfile(tmp_path / "bar")
+    f = await any_fs.open_async(tmp_path / "file4", mode="wb", use_aiofile=True)
+    async with f:
+        await any_fs._get_file(foo, f)
+    assert await any_fs._cat_file(tmp_path / "file4") == b"foo"
 
-    f = await fs.open_async(tmp_path / "file1", mode="wb")
+    monkeypatch.setattr(asyn_local, "_BUF_POOL", [])
+    f = await any_fs.open_async(tmp_path / "file1")
     async with f:
-        await fs._get_file(tmp_path / "foo", f)
-    assert await fs._cat_file(tmp_path / "file1") == b"foo"
+        with pytest.raises(io.UnsupportedOperation):
+            await any_fs._get_file(foo, f)
+    # the buffer may still be in use by the executor, so it is not reused
+    assert not asyn_local._BUF_POOL
 
-    with fs.open(tmp_path / "file2", mode="wb") as f:
-        await fs._get_file(tmp_path / "foo", f)
-    assert await fs._cat_file(tmp_path / "file2") == b"foo"
+    with any_fs.open(tmp_path / "file2", mode="wb") as f:
+        await any_fs._get_file(foo, f)
+    assert await any_fs._cat_file(tmp_path / "file2") == b"foo"
 
     with (tmp_path / "file3").open(mode="wb") as f:
-        await fs._get_file(tmp_path / "foo", f)
-    assert await fs._cat_file(tmp_path / "file3") == b"foo"
+        f.write(b"bar")
+        await any_fs._get_file(foo, f)
+        f.write(b"bar")
+    assert await any_fs._cat_file(tmp_path / "file3") == b"barfoobar"
+
+
+@pytest.mark.asyncio
+async def test_cat(tmp_path, any_fs):
+    await any_fs._pipe_file(tmp_path / "foo", b"foo")
+    await any_fs._pipe_file(tmp_path / "bar", b"bar")
+
+    assert await any_fs._cat(tmp_path / "foo") == b"foo"
+    assert await any_fs._cat([tmp_path / "foo", tmp_path / "bar"]) == {
+        any_fs._strip_protocol(tmp_path / "foo"): b"foo",
+        any_fs._strip_protocol(tmp_path / "bar"): b"bar",
+    }
+    assert await any_fs._cat_ranges(
+        [tmp_path / "foo", tmp_path / "bar"], [0, 1], [2, None]
+    ) == [b"fo", b"ar"]
+
+    assert await any_fs._cat_ranges(
+        [tmp_path / "foo"] * 4, [1, None, -2, 5], [None, -1, 10, None]
+    ) == [b"oo", b"fo", b"oo", b""]
+    with pytest.raises(IsADirectoryError):
+        await any_fs._cat_file(tmp_path)
+
+    # files whose size is not known upfront
+    proc_version = Path("/proc/version")
+    if proc_version.exists():
+        expected = proc_version.read_bytes()
+        assert await any_fs._cat_file(proc_version) == expected
+    await any_fs._pipe_file(tmp_path / "foo.bz2", bz2.compress(b"foo"))
+    assert await any_fs._cat_file(tmp_path / "foo.bz2", compression="bz2") == b"foo"
+    with pytest.raises(FileNotFoundError):
+        await any_fs._cat_file(tmp_path / "missing")
 
 
 @pytest.mark.asyncio
-async def test_auto_mkdir_on_open_async(tmp_path):
-    fs = AsyncLocalFileSystem(auto_mkdir=True)
+async def test_auto_mkdir_on_open_async(tmp_path, auto_mkdir_fs):
+    fs = auto_mkdir_fs
     f = await fs.open_async(tmp_path / "dir" / "file", mode="wb")
     async with f:
         await f.write(b"contents")
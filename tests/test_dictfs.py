@@ -1,16 +1,36 @@
 import errno
-from unittest.mock import ANY
 
 import pytest
 
 from morefs.dict import DictFS
 
 
-@pytest.fixture
-def dfs():
+class _Any:
+    """Compares equal to anything, without importing unittest.mock."""
+
+    def __eq__(self, other):
+        return True
+
+    def __repr__(self):
+        return "<ANY>"
+
+
+ANY = _Any()
+
+
+@pytest.fixture(scope="module")
+def dfs_pool():
     return DictFS()
 
 
+@pytest.fixture
+def dfs(dfs_pool):
+    dfs_pool.store.clear()
+    dfs_pool._intrans = False
+    dfs_pool._transaction = None
+    return dfs_pool
+
+
 def test_dictfs_should_not_be_cached():
     assert DictFS() is not DictFS()
 
@@ -84,59 +104,51 @@ def test_rm_file(dfs):
     assert not dfs.exists("/afile")
 
 
-def test_try_rm_file_not_existing(dfs):
-    with pytest.raises(FileNotFoundError):
-        dfs.rm_file("/not-existing")
-
-
-def test_try_rm_file_directory(dfs):
-    dfs.mkdir("dir")
-    with pytest.raises(IsADirectoryError):
-        dfs.rm_file("/dir")
-
-    with pytest.raises(FileNotFoundError):
-        dfs.rm_file("/dir/file")
-    assert dfs.isdir("/dir")
-
-
-def test_try_rm_file_under_filepath(dfs):
-    dfs.mkdir("/dir")
-    dfs.touch("/dir/file")
-    with pytest.raises(NotADirectoryError):
-        dfs.rm_file("/dir/file/foo")
-
-
 def test_rmdir(dfs):
     dfs.mkdir("/dir")
     dfs.rmdir("/dir")
     assert not dfs.exists("/dir")
 
 
-def test_try_rmdir_not_existing(dfs):
-    with pytest.raises(FileNotFoundError):
-        dfs.rmdir("/dir")
-
-
-def test_try_rmdir_file(dfs):
-    dfs.touch("/afile")
-    with pytest.raises(NotADirectoryError):
-        dfs.rmdir("/afile")
-    assert dfs.exists("/afile")
-
-
-def test_try_rmdir_non_empty_directory(dfs):
-    dfs.mkdir("/dir")
-    dfs.touch("/dir/afile")
-    with pytest.raises(OSError) as exc:  # noqa: PT011
-        dfs.rmdir("/dir")
-    assert exc.value.errno == errno.ENOTEMPTY
-
-
-def test_try_rmdir_under_filepath(dfs):
-    dfs.mkdir("/dir")
-    dfs.touch("/dir/file")
-    with pytest.raises(NotADirectoryError):
-        dfs.rmdir("/dir/file/foo")
+@pytest.mark.parametrize(
+    "dirs, files, op, path, exc, errno_",
+    [
+        ((), (), "rm_file", "/not-existing", FileNotFoundError, errno.ENOENT),
+        (("/dir",), (), "rm_file", "/dir", IsADirectoryError, errno.EISDIR),
+        (("/dir",), (), "rm_file", "/dir/file", FileNotFoundError, errno.ENOENT),
+        (
+            ("/dir",),
+            ("/dir/file",),
+            "rm_file",
+            "/dir/file/foo",
+            NotADirectoryError,
+            errno.ENOTDIR,
+        ),
+        ((), (), "rmdir", "/dir", FileNotFoundError, errno.ENOENT),
+        ((), ("/afile",), "rmdir", "/afile", NotADirectoryError, errno.ENOTDIR),
+        (("/dir",), ("/dir/afile",), "rmdir", "/dir", OSError, errno.ENOTEMPTY),
+        (
+            ("/dir",),
+            ("/dir/file",),
+            "rmdir",
+            "/dir/file/foo",
+            NotADirectoryError,
+            errno.ENOTDIR,
+        ),
+    ],
+)
+def test_try_rm_errors(dfs, dirs, files, op, path, exc, errno_):  # noqa: PLR0913
+    for d in dirs:
+        dfs.mkdir(d)
+    for f in files:
+        dfs.touch(f)
+
+    with pytest.raises(exc) as exc_info:
+        getattr(dfs, op)(path)
+    assert exc_info.value.errno == errno_
+
+    assert all(dfs.isdir(d) for d in dirs)
+    assert all(dfs.isfile(f) for f in files)
 
 
 def test_rm_multiple_files(dfs):
@@ -154,6 +166,19 @@ def test_remove_all(dfs):
     assert not dfs.ls("/")
 
 
+def test_recreate_removed_tree(dfs):
+    dfs.makedirs("/dir/subdir")
+    dfs.touch("/dir/subdir/afile")
+    dfs.rm("/dir", recursive=True)
+    assert not dfs.exists("/dir/subdir/afile")
+
+    dfs.touch("/dir")
+    assert dfs.isfile("/dir")
+    with pytest.raises(NotADirectoryError):
+        dfs.info("/dir/subdir")
+    assert set(dfs.store.nodes) == {(), ("dir",)}
+
+
 def test_rm_errors(dfs):
     with pytest.raises(FileNotFoundError):
         dfs.rm(["/dir", "/dir2"], recursive=True)
@@ -202,8 +227,8 @@ def test_makedirs(dfs):
     with pytest.raises(NotADirectoryError):
         dfs.makedirs("/afile/foo")
 
-    with pytest.raises(FileExistsError):
-        dfs.makedirs("/dir1/dir2/dir3")
+    dfs.makedirs("/dir1/dir2/dir3")
+    assert dfs.isdir("/dir1/dir2/dir3")
 
 
 def test_makedirs_exist_ok(dfs):
@@ -214,6 +239,8 @@ def test_makedirs_exist_ok(dfs):
 
     with pytest.raises(NotADirectoryError):
         dfs.makedirs("/afile/foo", exist_ok=True)
+    with pytest.raises(NotADirectoryError):
+        dfs.makedirs("/afile", exist_ok=True)
 
     dfs.makedirs("/dir1/dir2/dir3", exist_ok=True)
     assert dfs.isdir("/dir1/dir2/dir3")
@@ -295,6 +322,10 @@ def test_transaction(dfs):
     assert dfs.find("/") == ["/dir/afile"]
 
     with dfs.transaction:
-        dfs.touch("/dir/bfile")
+        dfs.pipe({"/dir/bfile": b"bfile", "/dir/cfile": b"cfile"})
         assert dfs.find("/") == ["/dir/afile"]
-    assert dfs.find("/") == ["/dir/afile", "/dir/bfile"]
+    assert dfs.find("/") == ["/dir/afile", "/dir/bfile", "/dir/cfile"]
+    assert dfs.cat(["/dir/bfile", "/dir/cfile"]) == {
+        "/dir/bfile": b"bfile",
+        "/dir/cfile": b"cfile",
+    }
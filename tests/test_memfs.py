@@ -198,6 +198,25 @@ def test_cp_file(m):
     m.cp_file("/afile", "/bfile")
     assert m.cat_file("/bfile") == m.cat_file("/afile") == b"content"
 
+    with m.open("/bfile", "ab") as f:
+        f.write(b"!")
+    assert m.cat_file("/afile") == b"content"
+    assert m.cat_file("/bfile") == b"content!"
+
+    m.pipe_file("/dir/file", b"")
+    with pytest.raises(IsADirectoryError):
+        m.cp_file("/afile", "/dir")
+    assert m.isdir("/dir")
+
+    with pytest.raises(NotADirectoryError):
+        m.cp_file("/bfile", "/afile/sub")
+    assert m.cat_file("/afile") == b"content"
+
+    with m.transaction:
+        m.cp_file("/afile", "/cfile")
+        assert not m.exists("/cfile")
+    assert m.cat_file("/cfile") == b"content"
+
 
 def test_transaction(m):
     m.start_transaction()
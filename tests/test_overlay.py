@@ -0,0 +1,70 @@
+import pytest
+
+from morefs.dict import DictFS
+from morefs.memory import MemFS
+from morefs.overlay import OverlayFileSystem
+
+
+@pytest.fixture
+def upper():
+    fs = DictFS()
+    fs.mkdir("/dir")
+    fs.pipe_file("/dir/b", b"upper")
+    fs.pipe_file("/dir/c", b"c")
+    return fs
+
+
+@pytest.fixture
+def lower():
+    fs = MemFS()
+    fs.pipe_file("/dir/b", b"lower!")
+    fs.pipe_file("/dir/a", b"a")
+    return fs
+
+
+@pytest.fixture
+def fs(upper, lower):
+    return OverlayFileSystem(upper, lower)
+
+
+def test_ls(fs):
+    assert fs.ls("/dir") == ["dir/a", "dir/b", "dir/c"]
+    # upper filesystem's entries first, in the order they are listed
+    assert fs.ls("/dir", sort=False) == ["dir/b", "dir/c", "dir/a"]
+
+    listing = fs.ls("/dir", detail=True)
+    assert [info["name"] for info in listing] == ["dir/a", "dir/b", "dir/c"]
+    # entries in the upper filesystem shadow the ones below them
+    assert [info["size"] for info in listing] == [1, 5, 1]
+    listing = fs.ls("/dir", detail=True, sort=False)
+    assert [info["name"] for info in listing] == ["dir/b", "dir/c", "dir/a"]
+
+    assert fs.ls("/missing") == []
+
+
+def test_info(fs, upper, lower):
+    assert fs.info("/dir/b") == upper.info("/dir/b")
+    assert fs.info("/dir/a") == lower.info("/dir/a")
+    with pytest.raises(FileNotFoundError):
+        fs.info("/missing")
+
+
+def test_created_modified(fs, upper, lower):
+    assert fs.created("/dir/b") == upper.created("/dir/b")
+    # not found in the upper filesystem
+    assert fs.created("/dir/a") == lower.created("/dir/a")
+    # neither filesystem implements it
+    with pytest.raises(NotImplementedError):
+        lower.modified("/dir/a")
+    with pytest.raises(FileNotFoundError):
+        fs.modified("/dir/a")
+
+
+def test_protocol_attributes(upper, lower):
+    fs = OverlayFileSystem(upper, lower, DictFS())
+    assert fs.memfs is lower
+    assert fs.memory is lower
+    # the first filesystem with the protocol wins
+    assert fs.dictfs is upper
+    with pytest.raises(AttributeError):
+        fs.s3  # noqa: B018